@@ -1,9 +1,77 @@
 """Collection of Numpy network layers, wrapped to fit Ivy syntax and signature."""
 
 # global
+import functools
 import numpy as np
 from typing import Union, Tuple, Optional, List
 
+try:
+    from scipy.signal import oaconvolve
+except (ImportError, ModuleNotFoundError):
+    oaconvolve = None
+
+# minimum number of (dilated) filter taps for which conv2d dispatches to the
+# FFT-based overlap-add convolution, below this the direct method is faster
+_FFT_CONV2D_MIN_FILTER_SIZE = 25
+
+# approximate number of bytes of input windows gathered per block of output rows
+# in the direct conv2d, chosen to fit comfortably within a typical L2 cache
+_CONV_BLOCK_BYTES = 2**19
+
+
+@functools.lru_cache(maxsize=32)
+def _zeros_buffer(shape, dtype):
+    return np.zeros(shape, dtype)
+
+
+def _pad_zeros(x, pad_width):
+    # the padded border of the cached buffer is never written to, so only the
+    # interior needs to be overwritten with x on each call
+    if not any(before or after for before, after in pad_width):
+        return x
+    padded_shape = tuple(
+        dim + before + after for dim, (before, after) in zip(x.shape, pad_width)
+    )
+    padded = _zeros_buffer(padded_shape, x.dtype.str)
+    padded[
+        tuple(
+            slice(before, before + dim) for dim, (before, _) in zip(x.shape, pad_width)
+        )
+    ] = x
+    return padded
+
+
+def _to_channels_last(x, data_format, contiguous=True):
+    if data_format[-1] == "C":
+        return x
+    x = np.moveaxis(x, 1, -1)
+    # make the transposed input contiguous once, so that the strided window views
+    # taken by the convolutions read from contiguous rows, unless it is about to be
+    # copied into a padded buffer anyway
+    return np.ascontiguousarray(x) if contiguous else x
+
+
+def _pad_same(x, filter_shape, strides):
+    x_shape = x.shape[1:3]
+    if x_shape[1] % strides[1] == 0:
+        pad_w = max(filter_shape[1] - strides[1], 0)
+    else:
+        pad_w = max(filter_shape[1] - (x_shape[1] % strides[1]), 0)
+
+    if x_shape[0] % strides[0] == 0:
+        pad_h = max(filter_shape[0] - strides[0], 0)
+    else:
+        pad_h = max(filter_shape[0] - (x_shape[0] % strides[0]), 0)
+    return _pad_zeros(
+        x,
+        [
+            (0, 0),
+            (pad_h // 2, pad_h - pad_h // 2),
+            (pad_w // 2, pad_w - pad_w // 2),
+            (0, 0),
+        ],
+    )
+
 
 def conv1d(
     x: np.ndarray,
@@ -19,22 +87,11 @@ def conv1d(
         strides = strides[0]
     if isinstance(dilations, tuple):
         dilations = dilations[0]
-    if data_format == "NCW":
-        x = np.transpose(x, (0, 2, 1))
-    x_shape = (1,) + x.shape
-    filter_shape = (1,) + filters.shape
-    x_strides = (x.strides[0],) + x.strides
-    filter_strides = (filters.strides[0],) + filters.strides
-    x = np.lib.stride_tricks.as_strided(x, shape=x_shape, strides=x_strides)
-    filters = np.lib.stride_tricks.as_strided(
-        filters, shape=filter_shape, strides=filter_strides
-    )
-    x = np.transpose(x, (1, 0, 2, 3))
+    x = _to_channels_last(x, data_format, padding != "SAME")
+    x = x[:, None]
+    filters = filters[None]
     res = conv2d(x, filters, strides, padding, "NHWC", dilations)
-    res = np.transpose(res, (1, 0, 2, 3))
-    res = np.lib.stride_tricks.as_strided(
-        res, shape=res.shape[1:], strides=res.strides[1:]
-    )
+    res = res[:, 0]
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
     return res
@@ -83,30 +140,31 @@ def conv2d(
     filter_shape = filters.shape[0:2]
     filter_shape = list(filter_shape)
 
-    if data_format == "NCHW":
-        x = np.transpose(x, (0, 2, 3, 1))
+    x = _to_channels_last(x, data_format, padding != "SAME")
 
-    x_shape = list(x.shape[1:3])
     if padding == "SAME":
-        if x_shape[1] % strides[1] == 0:
-            pad_w = max(filter_shape[1] - strides[1], 0)
-        else:
-            pad_w = max(filter_shape[1] - (x_shape[1] % strides[1]), 0)
+        x = _pad_same(x, filter_shape, strides)
 
-        if x_shape[0] % strides[0] == 0:
-            pad_h = max(filter_shape[0] - strides[0], 0)
-        else:
-            pad_h = max(filter_shape[0] - (x_shape[0] % strides[0]), 0)
-        x = np.pad(
-            x,
-            [
-                (0, 0),
-                (pad_h // 2, pad_h - pad_h // 2),
-                (pad_w // 2, pad_w - pad_w // 2),
-                (0, 0),
-            ],
-            "constant",
+    if (
+        oaconvolve is not None
+        and tuple(strides) == (1, 1)
+        and filter_shape[0] * filter_shape[1] >= _FFT_CONV2D_MIN_FILTER_SIZE
+        and x.shape[1] >= filter_shape[0]
+        and x.shape[2] >= filter_shape[1]
+        and np.issubdtype(x.dtype, np.floating)
+    ):
+        # B x OH x OW x I x O, flipping the filters to get a cross-correlation
+        mult = oaconvolve(
+            np.expand_dims(x, -1),
+            np.expand_dims(filters[::-1, ::-1], 0),
+            mode="valid",
+            axes=(1, 2),
         )
+        # B x OH x OW x O
+        res = np.sum(mult, 3).astype(x.dtype, copy=False)
+        if data_format == "NCHW":
+            return np.transpose(res, (0, 3, 1, 2))
+        return res
 
     x_shape = x.shape
     input_dim = filters.shape[-2]
@@ -116,8 +174,8 @@ def conv2d(
     new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
     new_strides = (
         x.strides[0],
-        x.strides[1] * strides[1],
-        x.strides[2] * strides[0],
+        x.strides[1] * strides[0],
+        x.strides[2] * strides[1],
         x.strides[1],
         x.strides[2],
         x.strides[3],
@@ -126,16 +184,18 @@ def conv2d(
     sub_matrices = np.lib.stride_tricks.as_strided(
         x, new_shape, new_strides, writeable=False
     )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
     # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    res = np.empty(
+        [x_shape[0], new_h, new_w, output_dim], np.result_type(x.dtype, filters.dtype)
+    )
+    # contract a block of output rows at a time, so that the windows gathered for
+    # each matrix multiplication stay small enough to remain in cache
+    row_bytes = x_shape[0] * new_w * np.prod(filter_shape) * input_dim * x.itemsize
+    block_rows = max(int(_CONV_BLOCK_BYTES // max(row_bytes, 1)), 1)
+    for row in range(0, new_h, block_rows):
+        res[:, row : row + block_rows] = np.tensordot(
+            sub_matrices[:, row : row + block_rows], filters, ((3, 4, 5), (0, 1, 2))
+        )
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
     return res
@@ -154,42 +214,39 @@ def depthwise_conv2d(
     strides = [strides] * 2 if isinstance(strides, int) else strides
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
 
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
-    depth = x.shape[0]
-    filters = np.transpose(filters, (2, 0, 1))
-    x = np.expand_dims(x, -1)
-    filters = np.expand_dims(filters, (-1, -2))
-    x_shape = x[0].shape
-    filter_shape = filters[0].shape
+    x = _to_channels_last(x, data_format, padding != "SAME")
+    filter_shape = list(filters.shape[0:2])
     filter_h = filter_shape[0] + (filter_shape[0] - 1) * (dilations[0] - 1)
     filter_w = filter_shape[1] + (filter_shape[1] - 1) * (dilations[1] - 1)
-    if padding == "VALID":
-        out_height = np.ceil(float(x_shape[1] - filter_h + 1) / float(strides[0]))
-        out_width = np.ceil(float(x_shape[2] - filter_w + 1) / float(strides[1]))
-    else:
-        out_height = np.ceil(float(x_shape[1]) / float(strides[0]))
-        out_width = np.ceil(float(x_shape[2]) / float(strides[1]))
-    if data_format == "NHWC":
-        outputs = np.empty([x_shape[0], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x_shape[0], 0, int(out_height), int(out_width)], x.dtype)
-    for i in range(depth):
-        output = conv2d(x[i], filters[i], strides, padding, "NHWC", dilations)
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(
-                outputs,
-                np.transpose(
-                    output,
-                    (0, 3, 1, 2)
-                ),
-                axis=1
-            )
-    return outputs
+
+    if padding == "SAME":
+        x = _pad_same(x, [filter_h, filter_w], strides)
+
+    # all channels are convolved at once, with the dilations applied through the
+    # strides of the window view rather than by inserting zeros into the filters
+    x_shape = x.shape
+    new_h = (x_shape[1] - filter_h) // strides[0] + 1
+    new_w = (x_shape[2] - filter_w) // strides[1] + 1
+    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
+    new_strides = (
+        x.strides[0],
+        x.strides[1] * strides[0],
+        x.strides[2] * strides[1],
+        x.strides[1] * dilations[0],
+        x.strides[2] * dilations[1],
+        x.strides[3],
+    )
+    # B x OH x OW x KH x KW x D
+    sub_matrices = np.lib.stride_tricks.as_strided(
+        x, new_shape, new_strides, writeable=False
+    )
+    # B x OH x OW x D
+    res = np.einsum("bhwijd,ijd->bhwd", sub_matrices, filters).astype(
+        x.dtype, copy=False
+    )
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv2d_transpose(*_):
@@ -238,8 +295,7 @@ def conv3d(
     filter_shape = filters.shape[0:3]
     filter_shape = list(filter_shape)
 
-    if data_format == "NCDHW":
-        x = np.transpose(x, (0, 2, 3, 4, 1))
+    x = _to_channels_last(x, data_format, padding != "SAME")
 
     x_shape = list(x.shape[1:4])
     if padding == "SAME":
@@ -257,7 +313,7 @@ def conv3d(
         else:
             pad_w = max(filter_shape[2] - (x_shape[2] % strides[2]), 0)
 
-        x = np.pad(
+        x = _pad_zeros(
             x,
             [
                 (0, 0),
@@ -266,7 +322,6 @@ def conv3d(
                 (pad_w // 2, pad_w - pad_w // 2),
                 (0, 0),
             ],
-            "constant",
         )
 
     x_shape = x.shape
@@ -12,6 +12,13 @@ from ivy.functional.ivy.random import (
     _check_valid_scale,
 )
 
+_rng = np.random.default_rng()
+
+# largest batch_size * num_samples * population_size for which multinomial samples
+# with replacement using the Gumbel-max trick, above this the noise tensor becomes
+# more expensive than an inverse-CDF search
+_MULTINOMIAL_GUMBEL_MAX_SIZE = 1024
+
 # Extra #
 # ------#
 
@@ -26,7 +33,13 @@ def random_uniform(
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     shape = _check_bounds_and_get_shape(low, high, shape)
-    return np.asarray(np.random.uniform(low, high, shape), dtype=dtype)
+    if np.dtype(dtype) == np.float32:
+        # sample in single precision directly, rather than casting down from double
+        ret = _rng.random(shape, dtype=np.float32)
+        ret *= high - low
+        ret += low
+        return ret
+    return np.asarray(_rng.uniform(low, high, shape), dtype=dtype)
 
 
 def random_normal(
@@ -40,7 +53,13 @@ def random_normal(
 ) -> np.ndarray:
     _check_valid_scale(std)
     shape = _check_bounds_and_get_shape(mean, std, shape)
-    return np.asarray(np.random.normal(mean, std, shape), dtype=dtype)
+    if np.dtype(dtype) == np.float32:
+        # sample in single precision directly, rather than casting down from double
+        ret = _rng.standard_normal(shape, dtype=np.float32)
+        ret *= std
+        ret += mean
+        return ret
+    return np.asarray(_rng.normal(mean, std, shape), dtype=dtype)
 
 
 def multinomial(
@@ -66,15 +85,41 @@ def multinomial(
     orig_probs_shape = list(probs.shape)
     num_classes = orig_probs_shape[-1]
     probs_flat = np.reshape(probs, (-1, orig_probs_shape[-1]))
-    probs_flat = probs_flat / np.sum(
-        probs_flat, -1, keepdims=True, dtype="float64", out=out
-    )
-    probs_stack = np.split(probs_flat, probs_flat.shape[0])
-    samples_stack = [
-        np.random.choice(num_classes, num_samples, replace, p=prob[0])
-        for prob in probs_stack
-    ]
-    samples_flat = np.stack(samples_stack, out=out)
+    if replace and probs_flat.size * num_samples <= _MULTINOMIAL_GUMBEL_MAX_SIZE:
+        # Gumbel-max sampling, classes with zero probability have a log
+        # probability of -inf and so are never the argmax
+        with np.errstate(divide="ignore"):
+            log_probs = np.log(probs_flat)[:, None, :]
+        noise = _rng.gumbel(size=(probs_flat.shape[0], num_samples, num_classes))
+        samples_flat = np.argmax(log_probs + noise, -1, out=out)
+    elif replace:
+        # inverse-CDF sampling of all batches at once. Normalising the cumulative
+        # sum by its last column makes each row of the CDF end exactly at 1, and
+        # offsetting each row by its index lets a single sorted search cover every
+        # row
+        batch_size = probs_flat.shape[0]
+        row_offsets = np.arange(batch_size)[:, None]
+        cdf = np.cumsum(probs_flat, -1, dtype="float64")
+        cdf /= cdf[:, -1:]
+        cdf += row_offsets
+        u = _rng.random((batch_size, num_samples)) + row_offsets
+        samples_flat = np.searchsorted(cdf.ravel(), u.ravel(), side="right")
+        samples_flat = samples_flat.reshape(batch_size, num_samples)
+        samples_flat -= row_offsets * num_classes
+        # u + row can round up to row + 1, which would select past the last class
+        # with non-zero probability in that row
+        last_classes = num_classes - 1 - np.argmax(probs_flat[:, ::-1] > 0, -1)
+        samples_flat = np.minimum(samples_flat, last_classes[:, None], out=out)
+    else:
+        probs_flat = probs_flat / np.sum(
+            probs_flat, -1, keepdims=True, dtype="float64"
+        )
+        probs_stack = np.split(probs_flat, probs_flat.shape[0])
+        samples_stack = [
+            _rng.choice(num_classes, num_samples, replace, p=prob[0])
+            for prob in probs_stack
+        ]
+        samples_flat = np.stack(samples_stack, out=out)
     return np.asarray(np.reshape(samples_flat, orig_probs_shape[:-1] + [num_samples]))
 
 
@@ -95,12 +140,13 @@ def randint(
     dtype = ivy.as_native_dtype(dtype)
     _randint_check_dtype_and_bound(low, high, dtype)
     shape = _check_bounds_and_get_shape(low, high, shape)
-    return np.random.randint(low, high, shape, dtype=dtype)
+    return _rng.integers(low, high, shape, dtype=dtype)
 
 
 def seed(seed_value: int = 0) -> None:
-    np.random.seed(seed_value)
+    global _rng
+    _rng = np.random.default_rng(seed_value)
 
 
 def shuffle(x: np.ndarray, *, out: Optional[np.ndarray] = None) -> np.ndarray:
-    return np.random.permutation(x)
+    return _rng.permutation(x)
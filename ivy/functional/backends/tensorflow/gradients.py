@@ -23,11 +23,25 @@ def variable_data(x):
     return x.value()
 
 
+def _is_trainable_variable(x):
+    return isinstance(x, tf.Variable) and x.trainable
+
+
+def _xs_are_trainable_variables(xs):
+    if isinstance(xs, ivy.Container):
+        return all(_is_trainable_variable(x) for x in xs.to_iterator_values())
+    return _is_trainable_variable(xs)
+
+
 def execute_with_gradients(func, xs, retain_grads=False):
+    # trainable variables are tracked by the tape automatically, so only watch
+    # explicitly when xs contains plain tensors or non-trainable variables
+    xs_are_variables = _xs_are_trainable_variables(xs)
     with tf.GradientTape(
-        persistent=retain_grads, watch_accessed_variables=False
+        persistent=retain_grads, watch_accessed_variables=xs_are_variables
     ) as tape:
-        tape.watch(xs)
+        if not xs_are_variables:
+            tape.watch(xs)
         func_ret = func(xs)
     if isinstance(func_ret, tuple):
         y = func_ret[0]
@@ -37,9 +51,9 @@ def execute_with_gradients(func, xs, retain_grads=False):
         rest = tuple()
     y = ivy.to_native(y)
     grads = tape.gradient(y, xs)
-    y = ivy.to_ivy(y)
     if not retain_grads:
-        y = ivy.stop_gradient(y)
+        y = tf.stop_gradient(y)
+    y = ivy.to_ivy(y)
     return (y, grads, *rest)
 
 
@@ -49,8 +63,7 @@ def stop_gradient(
     *,
     out: Optional[Union[tf.Tensor, tf.Variable]] = None
 ) -> Union[tf.Tensor, tf.Variable]:
-    is_var = is_variable(x)
-    x = tf.stop_gradient(x)
-    if is_var and preserve_type:
-        return variable(x)
-    return x
+    x_stopped = tf.stop_gradient(x)
+    if preserve_type and is_variable(x):
+        return variable(x_stopped)
+    return x_stopped
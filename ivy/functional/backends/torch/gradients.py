@@ -34,16 +34,16 @@ def execute_with_gradients(func, xs, retain_grads=False):
         rest = tuple()
     y = ivy.to_native(y)
     if isinstance(xs, ivy.Container):
-        x_grads_flat = list(
+        x_grads_iter = iter(
             torch.autograd.grad(
                 [y],
-                [v for k, v in xs.to_iterator()],
+                list(xs.to_iterator_values()),
                 retain_graph=retain_grads,
                 create_graph=retain_grads,
             )
         )
-        grads = xs.from_flat_list(x_grads_flat)
-        grads = grads.to_ivy()
+        # map visits the leaves in the same order as to_iterator_values
+        grads = xs.map(lambda _, __: ivy.to_ivy(next(x_grads_iter)))
     else:
         grads = torch.autograd.grad(
             y,
@@ -51,9 +51,9 @@ def execute_with_gradients(func, xs, retain_grads=False):
             retain_graph=retain_grads,
             create_graph=retain_grads,
         )[0]
-    y = ivy.to_ivy(y)
     if not retain_grads:
-        y = ivy.stop_gradient(y)
+        y = stop_gradient(y)
+    y = ivy.to_ivy(y)
     return (y, grads, *rest)
 
 
@@ -1,17 +1,23 @@
 """Collection of helpers for ivy unit tests."""
 
 # global
+import functools
 import importlib
+import os
 from contextlib import redirect_stdout
 from io import StringIO
-import sys
 import re
+import textwrap
 import inspect
 import numpy as np
 import math
 from typing import Union, List
 
 TOLERANCE_DICT = {"float16": 1e-2, "float32": 1e-5, "float64": 1e-5, None: 1e-5}
+# also keyed by numpy dtypes, so returned arrays can be looked up without str()
+TOLERANCE_DICT.update(
+    {np.dtype(k): v for k, v in TOLERANCE_DICT.items() if k is not None}
+)
 cmd_line_args = (
     "as_variable",
     "native_array",
@@ -22,9 +28,14 @@ cmd_line_args = (
 )
 
 try:
+    import jax
     import jax.numpy as jnp
 except (ImportError, RuntimeError, AttributeError):
+    jax = None
     jnp = None
+# let TensorFlow grow its GPU memory when it first initialises the devices, rather
+# than listing and configuring the physical devices on import
+os.environ.setdefault("TF_FORCE_GPU_ALLOW_GROWTH", "true")
 try:
     import tensorflow as tf
 
@@ -36,9 +47,6 @@ try:
         # noinspection PyPep8Naming
         # noinspection PyProtectedMember,PyUnresolvedReferences
         from tensorflow.python.framework.tensor_like import _TensorLike as tensor_type
-    physical_devices = tf.config.list_physical_devices("GPU")
-    for device in physical_devices:
-        tf.config.experimental.set_memory_growth(device, True)
 except ImportError:
     tf = None
 try:
@@ -59,6 +67,7 @@ import ivy
 import ivy.functional.backends.numpy as ivy_np
 
 
+@functools.lru_cache(maxsize=None)
 def get_ivy_numpy():
     try:
         import ivy.functional.backends.numpy
@@ -67,6 +76,7 @@ def get_ivy_numpy():
     return ivy.functional.backends.numpy
 
 
+@functools.lru_cache(maxsize=None)
 def get_ivy_jax():
     try:
         import ivy.functional.backends.jax
@@ -75,6 +85,7 @@ def get_ivy_jax():
     return ivy.functional.backends.jax
 
 
+@functools.lru_cache(maxsize=None)
 def get_ivy_tensorflow():
     try:
         import ivy.functional.backends.tensorflow
@@ -83,6 +94,7 @@ def get_ivy_tensorflow():
     return ivy.functional.backends.tensorflow
 
 
+@functools.lru_cache(maxsize=None)
 def get_ivy_torch():
     try:
         import ivy.functional.backends.torch
@@ -91,6 +103,7 @@ def get_ivy_torch():
     return ivy.functional.backends.torch
 
 
+@functools.lru_cache(maxsize=None)
 def get_ivy_mxnet():
     try:
         import ivy.functional.backends.mxnet
@@ -99,45 +112,70 @@ def get_ivy_mxnet():
     return ivy.functional.backends.mxnet
 
 
-_ivy_fws_dict = {
-    "numpy": lambda: get_ivy_numpy(),
-    "jax": lambda: get_ivy_jax(),
-    "tensorflow": lambda: get_ivy_tensorflow(),
-    "tensorflow_graph": lambda: get_ivy_tensorflow(),
-    "torch": lambda: get_ivy_torch(),
-    "mxnet": lambda: get_ivy_mxnet(),
-}
-
-_iterable_types = [list, tuple, dict]
 _excluded = []
 
+# 7-bit C1 ANSI sequences, stripped from the stdout of docstring examples
+_ANSI_ESCAPE_RE = re.compile(
+    r"""
+    \x1B  # ESC
+    (?:   # 7-bit C1 Fe (except CSI)
+        [@-Z\\-_]
+    |     # or [ for CSI, followed by a control sequence
+        \[
+        [0-?]*  # Parameter bytes
+        [ -/]*  # Intermediate bytes
+        [@-~]   # Final byte
+    )
+    """,
+    re.VERBOSE,
+)
+_PRINT_PREFIX = ">>> print("
+
 
-def _convert_vars(
-    *, vars_in, from_type, to_type_callable=None, keep_other=True, to_type=None
-):
-    new_vars = list()
-    for var in vars_in:
-        if type(var) in _iterable_types:
-            return_val = _convert_vars(
-                vars_in=var, from_type=from_type, to_type_callable=to_type_callable
-            )
-            new_vars.append(return_val)
-        elif isinstance(var, from_type):
-            if isinstance(var, np.ndarray):
-                if var.dtype == np.float64:
-                    var = var.astype(np.float32)
-                if bool(sum([stride < 0 for stride in var.strides])):
-                    var = var.copy()
-            if to_type_callable:
-                new_vars.append(to_type_callable(var))
-            else:
-                raise Exception("Invalid. A conversion callable is required.")
-        elif to_type is not None and isinstance(var, to_type):
-            new_vars.append(var)
-        elif keep_other:
-            new_vars.append(var)
+def _normalize_np(var):
+    if isinstance(var, np.ndarray):
+        if var.dtype == np.float64:
+            var = var.astype(np.float32)
+        # also copies arrays with negative strides, which are never c-contiguous
+        if not var.flags.c_contiguous:
+            var = np.ascontiguousarray(var)
+    return var
 
-    return new_vars
+
+def _convert_vars(*, vars_in, from_type, to_type_callable):
+    """Converts all leaves of the nest vars_in which are instances of from_type, in a
+    single pass over the nest, and returns a mutable copy of the nest."""
+    idxs = ivy.nested_indices_where(
+        vars_in, lambda x: isinstance(x, from_type), to_ignore=ivy.Container
+    )
+    vars_out = ivy.copy_nest(vars_in, to_mutable=True)
+    if idxs:
+        new_leaves = [
+            to_type_callable(_normalize_np(var))
+            for var in ivy.multi_index_nest(vars_in, idxs)
+        ]
+        ivy.set_nest_at_indices(vars_out, idxs, new_leaves)
+    return vars_out
+
+
+def _convert_kwargs(*, kwargs, to_type_callable):
+    return _convert_vars(
+        vars_in=kwargs, from_type=np.ndarray, to_type_callable=to_type_callable
+    )
+
+
+def _convert_output(*, output, from_type):
+    if isinstance(output, tuple):
+        return tuple(
+            _convert_vars(
+                vars_in=list(output),
+                from_type=from_type,
+                to_type_callable=ivy.to_numpy,
+            )
+        )
+    return _convert_vars(
+        vars_in=[output], from_type=from_type, to_type_callable=ivy.to_numpy
+    )[0]
 
 
 def np_call(func, *args, **kwargs):
@@ -151,145 +189,85 @@ def jnp_call(func, *args, **kwargs):
     new_args = _convert_vars(
         vars_in=args, from_type=np.ndarray, to_type_callable=jnp.asarray
     )
-    new_kw_vals = _convert_vars(
-        vars_in=kwargs.values(), from_type=np.ndarray, to_type_callable=jnp.asarray
-    )
-    new_kwargs = dict(zip(kwargs.keys(), new_kw_vals))
+    new_kwargs = _convert_kwargs(kwargs=kwargs, to_type_callable=jnp.asarray)
     output = func(*new_args, **new_kwargs)
-    if isinstance(output, tuple):
-        return tuple(
-            _convert_vars(
-                vars_in=output,
-                from_type=(jnp.ndarray, ivy.Array),
-                to_type_callable=ivy.to_numpy,
-            )
-        )
-    else:
-        return _convert_vars(
-            vars_in=[output],
-            from_type=(jnp.ndarray, ivy.Array),
-            to_type_callable=ivy.to_numpy,
-        )[0]
+    return _convert_output(output=output, from_type=(jnp.ndarray, ivy.Array))
 
 
 def tf_call(func, *args, **kwargs):
     new_args = _convert_vars(
         vars_in=args, from_type=np.ndarray, to_type_callable=tf.convert_to_tensor
     )
-    new_kw_vals = _convert_vars(
-        vars_in=kwargs.values(),
-        from_type=np.ndarray,
-        to_type_callable=tf.convert_to_tensor,
-    )
-    new_kwargs = dict(zip(kwargs.keys(), new_kw_vals))
+    new_kwargs = _convert_kwargs(kwargs=kwargs, to_type_callable=tf.convert_to_tensor)
     output = func(*new_args, **new_kwargs)
-    if isinstance(output, tuple):
-        return tuple(
-            _convert_vars(
-                vars_in=output,
-                from_type=(tensor_type, ivy.Array),
-                to_type_callable=ivy.to_numpy,
-            )
-        )
-    else:
-        return _convert_vars(
-            vars_in=[output],
-            from_type=(tensor_type, ivy.Array),
-            to_type_callable=ivy.to_numpy,
-        )[0]
+    return _convert_output(output=output, from_type=(tensor_type, ivy.Array))
+
+
+# graph functions built by tf_graph_call, reused across calls to avoid retracing
+_tf_graph_fns = dict()
 
 
 def tf_graph_call(func, *args, **kwargs):
     new_args = _convert_vars(
         vars_in=args, from_type=np.ndarray, to_type_callable=tf.convert_to_tensor
     )
-    new_kw_vals = _convert_vars(
-        vars_in=kwargs.values(),
-        from_type=np.ndarray,
-        to_type_callable=tf.convert_to_tensor,
-    )
-    new_kwargs = dict(zip(kwargs.keys(), new_kw_vals))
-
-    @tf.function
-    def tf_func(*local_args, **local_kwargs):
-        return func(*local_args, **local_kwargs)
-
-    output = tf_func(*new_args, **new_kwargs)
-
-    if isinstance(output, tuple):
-        return tuple(
-            _convert_vars(
-                vars_in=output,
-                from_type=(tensor_type, ivy.Array),
-                to_type_callable=ivy.to_numpy,
-            )
+    new_kwargs = _convert_kwargs(kwargs=kwargs, to_type_callable=tf.convert_to_tensor)
+    tf_func = _tf_graph_fns.get(func)
+    if tf_func is None:
+        tf_func = (
+            tf.function(func, reduce_retracing=True)
+            if _tf_version >= 2.9
+            else tf.function(func)
         )
-    else:
-        return _convert_vars(
-            vars_in=[output],
-            from_type=(tensor_type, ivy.Array),
-            to_type_callable=ivy.to_numpy,
-        )[0]
+        _tf_graph_fns[func] = tf_func
+    output = tf_func(*new_args, **new_kwargs)
+    return _convert_output(output=output, from_type=(tensor_type, ivy.Array))
 
 
 def torch_call(func, *args, **kwargs):
     new_args = _convert_vars(
-        vars_in=args, from_type=np.ndarray, to_type_callable=torch.from_numpy
+        vars_in=args, from_type=np.ndarray, to_type_callable=torch.as_tensor
     )
-    new_kw_vals = _convert_vars(
-        vars_in=kwargs.values(), from_type=np.ndarray, to_type_callable=torch.from_numpy
-    )
-    new_kwargs = dict(zip(kwargs.keys(), new_kw_vals))
+    new_kwargs = _convert_kwargs(kwargs=kwargs, to_type_callable=torch.as_tensor)
     output = func(*new_args, **new_kwargs)
-    if isinstance(output, tuple):
-        return tuple(
-            _convert_vars(
-                vars_in=output,
-                from_type=(torch.Tensor, ivy.Array),
-                to_type_callable=ivy.to_numpy,
-            )
-        )
-    else:
-        return _convert_vars(
-            vars_in=[output],
-            from_type=(torch.Tensor, ivy.Array),
-            to_type_callable=ivy.to_numpy,
-        )[0]
+    return _convert_output(output=output, from_type=(torch.Tensor, ivy.Array))
 
 
 def mx_call(func, *args, **kwargs):
     new_args = _convert_vars(
         vars_in=args, from_type=np.ndarray, to_type_callable=mx_nd.array
     )
-    new_kw_items = _convert_vars(
-        vars_in=kwargs.values(), from_type=np.ndarray, to_type_callable=mx_nd.array
-    )
-    new_kwargs = dict(zip(kwargs.keys(), new_kw_items))
+    new_kwargs = _convert_kwargs(kwargs=kwargs, to_type_callable=mx_nd.array)
     output = func(*new_args, **new_kwargs)
-    if isinstance(output, tuple):
-        return tuple(
-            _convert_vars(
-                vars_in=output,
-                from_type=(mx_nd.ndarray.NDArray, ivy.Array),
-                to_type_callable=ivy.to_numpy,
-            )
-        )
-    else:
-        return _convert_vars(
-            vars_in=[output],
-            from_type=(mx_nd.ndarray.NDArray, ivy.Array),
-            to_type_callable=ivy.to_numpy,
-        )[0]
+    return _convert_output(
+        output=output, from_type=(mx_nd.ndarray.NDArray, ivy.Array)
+    )
 
 
-_calls = [np_call, jnp_call, tf_call, tf_graph_call, torch_call, mx_call]
+# (name, ivy backend, call) of each available framework, resolved once at import
+_BACKENDS = tuple(
+    (fw_str, ivy_fw, call)
+    for fw_str, ivy_fw, call in (
+        ("numpy", get_ivy_numpy(), np_call),
+        ("jax", get_ivy_jax(), jnp_call),
+        ("tensorflow", get_ivy_tensorflow(), tf_call),
+        ("tensorflow_graph", get_ivy_tensorflow(), tf_graph_call),
+        ("torch", get_ivy_torch(), torch_call),
+        ("mxnet", get_ivy_mxnet(), mx_call),
+    )
+    if ivy_fw is not None
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_once(fn, backend_str):
+    # only successful compilations are cached, failures raise on every call
+    ivy.compile(fn)
+    return True
 
 
 def assert_compilable(fn):
-    try:
-        ivy.compile(fn)
-    except Exception as e:
-        raise e
+    _compile_once(fn, ivy.current_backend_str())
 
 
 # function that trims white spaces from docstrings
@@ -300,31 +278,47 @@ def trim(*, docstring):
     # Convert tabs to spaces (following the normal Python rules)
     # and split into a list of lines:
     lines = docstring.expandtabs().splitlines()
-    # Determine minimum indentation (first line doesn't count):
-    indent = sys.maxsize
-    for line in lines[1:]:
-        stripped = line.lstrip()
-        if stripped:
-            indent = min(indent, len(line) - len(stripped))
     # Remove indentation (first line is special):
-    trimmed = [lines[0].strip()]
-    if indent < sys.maxsize:
-        for line in lines[1:]:
-            trimmed.append(line[indent:].rstrip())
+    body = textwrap.dedent("\n".join(lines[1:]))
+    trimmed = [lines[0].strip()] + [line.rstrip() for line in body.split("\n")]
     # Strip off trailing and leading blank lines:
-    while trimmed and not trimmed[-1]:
-        trimmed.pop()
-    while trimmed and not trimmed[0]:
-        trimmed.pop(0)
+    trimmed = "\n".join(trimmed).strip("\n")
 
     # Current code/unittests expects a line return at
     # end of multiline docstrings
     # workaround expected behavior from unittests
-    if "\n" in docstring:
-        trimmed.append("")
+    if trimmed and "\n" in docstring:
+        trimmed += "\n"
+    return trimmed
 
-    # Return a single string:
-    return "\n".join(trimmed)
+
+def _exec_example_lines(lines, *, namespace):
+    # the lines are compiled as one block, after a failing line the execution resumes
+    # with the remaining lines, matching the behaviour of running them one by one
+    start = 0
+    while start < len(lines):
+        try:
+            code = compile("\n".join(lines[start:]), "<docstring>", "exec")
+        except SyntaxError:
+            # some lines are not valid on their own, so they are run one at a time
+            for line in lines[start:]:
+                # noinspection PyBroadException
+                try:
+                    exec(line, namespace)
+                except Exception as e:
+                    print(e, " ", ivy.current_backend_str(), " ", line)
+            return
+        # noinspection PyBroadException
+        try:
+            exec(code, namespace)
+            return
+        except Exception as e:
+            tb = e.__traceback__
+            while tb.tb_frame.f_code is not code:
+                tb = tb.tb_next
+            failed = start + tb.tb_lineno - 1
+            print(e, " ", ivy.current_backend_str(), " ", lines[failed])
+            start = failed + 1
 
 
 def docstring_examples_run(*, fn, from_container=False, from_array=False):
@@ -345,7 +339,8 @@ def docstring_examples_run(*, fn, from_container=False, from_array=False):
     else:
         docstring = ivy.backend_handler.ivy_original_dict[fn_name].__doc__
 
-    if docstring is None:
+    # docstrings without any examples have nothing to run
+    if docstring is None or ">>>" not in docstring:
         return True
 
     # removing extra new lines and trailing white spaces from the docstrings
@@ -358,11 +353,14 @@ def docstring_examples_run(*, fn, from_container=False, from_array=False):
     # parsed_output is set as an empty string to manage functions with multiple inputs
     parsed_output = ""
 
-    # parsing through the docstrings to find lines with print statement
-    # following which is our parsed output
-    sub = ">>> print("
+    # parsing through the docstrings in a single pass, collecting the executable lines
+    # and the parsed output which follows each line with a print statement
+    executable_lines = []
     for index, line in enumerate(trimmed_docstring):
-        if sub in line:
+        if ">>>" not in line:
+            continue
+        executable_lines.append(line.split(">>>")[1][1:])
+        if _PRINT_PREFIX in line:
             end_index = trimmed_docstring.index("", index)
             p_output = trimmed_docstring[index + 1 : end_index]
             p_output = ("").join(p_output).replace(" ", "")
@@ -371,42 +369,16 @@ def docstring_examples_run(*, fn, from_container=False, from_array=False):
     if end_index == -1:
         return True
 
-    executable_lines = [
-        line.split(">>>")[1][1:] for line in docstring.split("\n") if ">>>" in line
-    ]
-
-    # noinspection PyBroadException
     f = StringIO()
     with redirect_stdout(f):
-        for line in executable_lines:
-            # noinspection PyBroadException
-            try:
-                exec(line)
-            except Exception as e:
-                print(e, " ", ivy.current_backend_str(), " ", line)
+        _exec_example_lines(executable_lines, namespace=dict(globals()))
 
     output = f.getvalue()
     output = output.rstrip()
     output = output.replace(" ", "").replace("\n", "")
 
     # handling cases when the stdout contains ANSI colour codes
-    # 7-bit C1 ANSI sequences
-    ansi_escape = re.compile(
-        r"""
-    \x1B  # ESC
-    (?:   # 7-bit C1 Fe (except CSI)
-        [@-Z\\-_]
-    |     # or [ for CSI, followed by a control sequence
-        \[
-        [0-?]*  # Parameter bytes
-        [ -/]*  # Intermediate bytes
-        [@-~]   # Final byte
-    )
-    """,
-        re.VERBOSE,
-    )
-
-    output = ansi_escape.sub("", output)
+    output = _ANSI_ESCAPE_RE.sub("", output)
 
     # print("Output: ", output)
     # print("Putput: ", parsed_output)
@@ -439,29 +411,17 @@ def exclude(*, exclusion_list):
 
 def frameworks():
     return list(
-        set(
-            [
-                ivy_fw()
-                for fw_str, ivy_fw in _ivy_fws_dict.items()
-                if ivy_fw() is not None and fw_str not in _excluded
-            ]
-        )
+        set([ivy_fw for fw_str, ivy_fw, _ in _BACKENDS if fw_str not in _excluded])
     )
 
 
 def calls():
-    return [
-        call
-        for (fw_str, ivy_fw), call in zip(_ivy_fws_dict.items(), _calls)
-        if ivy_fw() is not None and fw_str not in _excluded
-    ]
+    return [call for fw_str, _, call in _BACKENDS if fw_str not in _excluded]
 
 
 def f_n_calls():
     return [
-        (ivy_fw(), call)
-        for (fw_str, ivy_fw), call in zip(_ivy_fws_dict.items(), _calls)
-        if ivy_fw() is not None and fw_str not in _excluded
+        (ivy_fw, call) for fw_str, ivy_fw, call in _BACKENDS if fw_str not in _excluded
     ]
 
 
@@ -476,7 +436,7 @@ def assert_all_close(ret_np, ret_from_np, rtol=1e-05, atol=1e-08):
         ivy.Container.multi_map(assert_all_close, [ret_np, ret_from_np])
     else:
         assert np.allclose(
-            np.nan_to_num(ret_np), np.nan_to_num(ret_from_np), rtol=rtol, atol=atol
+            ret_np, ret_from_np, rtol=rtol, atol=atol, equal_nan=True
         ), "{} != {}".format(ret_np, ret_from_np)
 
 
@@ -498,7 +458,23 @@ def as_lists(*args):
     return (a if isinstance(a, list) else [a] for a in args)
 
 
+def _to_numpy_all(arrays):
+    if arrays and ivy.current_backend_str() == "jax":
+        # the device to host copies of all arrays are started together, and only
+        # waited on once, rather than synchronising for every array in turn
+        return [
+            np.asarray(x) for x in jax.device_get([ivy.to_native(x) for x in arrays])
+        ]
+    return [ivy.to_numpy(x) for x in arrays]
+
+
 def flatten(*, ret):
+    # fast paths for a single array and a flat sequence of arrays
+    if ivy.is_ivy_array(ret):
+        return _to_numpy_all([ret])
+    if isinstance(ret, (list, tuple)) and all(ivy.is_ivy_array(x) for x in ret):
+        return _to_numpy_all(ret)
+
     # flatten the return
     if not isinstance(ret, tuple):
         ret = (ret,)
@@ -507,8 +483,7 @@ def flatten(*, ret):
     ret_flat = ivy.multi_index_nest(ret, ret_idxs)
 
     # convert the return to NumPy
-    ret_np_flat = [ivy.to_numpy(x) for x in ret_flat]
-    return ret_np_flat
+    return _to_numpy_all(ret_flat)
 
 
 def get_ret_and_flattened_array(func, *args, **kwargs):
@@ -523,13 +498,13 @@ def value_test(*, ret_np_flat, ret_from_np_flat, rtol=None, atol=1e-6):
         ret_from_np_flat = [ret_from_np_flat]
     assert len(ret_np_flat) == len(ret_from_np_flat)
     # value tests, iterating through each array in the flattened returns
-    if not rtol:
-        for ret_np, ret_from_np in zip(ret_np_flat, ret_from_np_flat):
-            rtol = TOLERANCE_DICT.get(str(ret_from_np.dtype), 1e-03)
-            assert_all_close(ret_np, ret_from_np, rtol=rtol, atol=atol)
-    else:
-        for ret_np, ret_from_np in zip(ret_np_flat, ret_from_np_flat):
-            assert_all_close(ret_np, ret_from_np, rtol=rtol, atol=atol)
+    for ret_np, ret_from_np in zip(ret_np_flat, ret_from_np_flat):
+        assert_all_close(
+            ret_np,
+            ret_from_np,
+            rtol=rtol or TOLERANCE_DICT.get(ret_from_np.dtype, 1e-03),
+            atol=atol,
+        )
 
 
 def args_to_container(array_args):
@@ -555,8 +530,8 @@ def gradient_test(
         array_vals = [v for k, v in xs.to_iterator()]
         arg_array_vals = array_vals[0 : len(args_idxs)]
         kwarg_array_vals = array_vals[len(args_idxs) :]
-        args_writeable = ivy.copy_nest(args)
-        kwargs_writeable = ivy.copy_nest(kwargs)
+        args_writeable = _copy_nest_for_indices(args, args_idxs)
+        kwargs_writeable = _copy_nest_for_indices(kwargs, kwargs_idxs)
         ivy.set_nest_at_indices(args_writeable, args_idxs, arg_array_vals)
         ivy.set_nest_at_indices(kwargs_writeable, kwargs_idxs, kwarg_array_vals)
         return ivy.mean(ivy.__dict__[fn_name](*args_writeable, **kwargs_writeable))
@@ -576,6 +551,9 @@ def gradient_test(
         ivy.execute_with_gradients, grad_fn, xs
     )
     grads_np_flat = ret_np_flat[1]
+    if ground_truth_backend == ivy.current_backend_str():
+        # the gradients would only be compared against themselves
+        return
     # compute the return with a Ground Truth backend
     ivy.set_backend(ground_truth_backend)
     test_unsupported = check_unsupported_dtype(
@@ -585,13 +563,15 @@ def gradient_test(
     )
     if test_unsupported:
         return
-    args, kwargs, _, args_idxs, kwargs_idxs = create_args_kwargs(
+    args, kwargs, _, _, _ = create_args_kwargs(
         args_np=args_np,
         kwargs_np=kwargs_np,
         input_dtypes=input_dtypes,
         as_variable_flags=as_variable_flags,
         native_array_flags=native_array_flags,
         container_flags=container_flags,
+        args_idxs=args_idxs,
+        kwargs_idxs=kwargs_idxs,
     )
     arg_array_vals = list(ivy.multi_index_nest(args, args_idxs))
     kwarg_array_vals = list(ivy.multi_index_nest(kwargs, kwargs_idxs))
@@ -610,63 +590,64 @@ def gradient_test(
     )
 
 
+@functools.lru_cache(maxsize=4096)
+def _function_dtypes(fn, backend_str):
+    # backend_str is only part of the cache key, the current backend is queried
+    return (
+        frozenset(ivy.function_unsupported_dtypes(fn)),
+        frozenset(ivy.function_supported_dtypes(fn)),
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _function_devices(fn, backend_str):
+    return (
+        frozenset(ivy.function_unsupported_devices(fn)),
+        frozenset(ivy.function_supported_devices(fn)),
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _function_devices_and_dtypes(fn, backend_str):
+    return (
+        ivy.function_unsupported_devices_and_dtypes(fn),
+        ivy.function_supported_devices_and_dtypes(fn),
+    )
+
+
 def check_unsupported_dtype(*, fn, input_dtypes, all_as_kwargs_np):
     # check for unsupported dtypes
-    test_unsupported = False
-    unsupported_dtypes_fn = ivy.function_unsupported_dtypes(fn)
-    supported_dtypes_fn = ivy.function_supported_dtypes(fn)
-    if unsupported_dtypes_fn:
-        for d in input_dtypes:
-            if d in unsupported_dtypes_fn:
-                test_unsupported = True
-                break
-        if (
-            "dtype" in all_as_kwargs_np
-            and all_as_kwargs_np["dtype"] in unsupported_dtypes_fn
-        ):
-            test_unsupported = True
-    if supported_dtypes_fn and not test_unsupported:
-        for d in input_dtypes:
-            if d not in supported_dtypes_fn:
-                test_unsupported = True
-                break
-        if (
-            "dtype" in all_as_kwargs_np
-            and all_as_kwargs_np["dtype"] not in supported_dtypes_fn
-        ):
-            test_unsupported = True
-    return test_unsupported
+    unsupported_dtypes_fn, supported_dtypes_fn = _function_dtypes(
+        fn, ivy.current_backend_str()
+    )
+    dtypes = set(input_dtypes)
+    if "dtype" in all_as_kwargs_np:
+        dtypes.add(all_as_kwargs_np["dtype"])
+    if unsupported_dtypes_fn and not dtypes.isdisjoint(unsupported_dtypes_fn):
+        return True
+    return bool(supported_dtypes_fn) and not dtypes <= supported_dtypes_fn
 
 
 def check_unsupported_device(*, fn, input_device, all_as_kwargs_np):
-    # check for unsupported dtypes
-    test_unsupported = False
-    unsupported_devices_fn = ivy.function_unsupported_devices(fn)
-    supported_devices_fn = ivy.function_supported_devices(fn)
-    if unsupported_devices_fn:
-        if input_device in unsupported_devices_fn:
-            test_unsupported = True
-        if (
-            "device" in all_as_kwargs_np
-            and all_as_kwargs_np["device"] in unsupported_devices_fn
-        ):
-            test_unsupported = True
-    if supported_devices_fn and not test_unsupported:
-        if input_device not in supported_devices_fn:
-            test_unsupported = True
-        if (
-            "device" in all_as_kwargs_np
-            and all_as_kwargs_np["device"] not in supported_devices_fn
-        ):
-            test_unsupported = True
-    return test_unsupported
+    # check for unsupported devices
+    unsupported_devices_fn, supported_devices_fn = _function_devices(
+        fn, ivy.current_backend_str()
+    )
+    devices = {input_device}
+    if "device" in all_as_kwargs_np:
+        devices.add(all_as_kwargs_np["device"])
+    if unsupported_devices_fn and not devices.isdisjoint(unsupported_devices_fn):
+        return True
+    return bool(supported_devices_fn) and not devices <= supported_devices_fn
 
 
 def check_unsupported_device_and_dtype(*, fn, device, input_dtypes, all_as_kwargs_np):
     # check for unsupported dtypes
     test_unsupported = False
-    unsupported_devices_dtypes_fn = ivy.function_unsupported_devices_and_dtypes(fn)
-    supported_devices_dtypes_fn = ivy.function_supported_devices_and_dtypes(fn)
+    (
+        unsupported_devices_dtypes_fn,
+        supported_devices_dtypes_fn,
+    ) = _function_devices_and_dtypes(fn, ivy.current_backend_str())
     for i in range(len(unsupported_devices_dtypes_fn["devices"])):
         if device in unsupported_devices_dtypes_fn["devices"][i]:
             for d in input_dtypes:
@@ -713,6 +694,54 @@ def check_unsupported_device_and_dtype(*, fn, device, input_dtypes, all_as_kwarg
     return test_unsupported
 
 
+def _copy_nest_for_indices(nest, idxs):
+    # copies the nest so that it can be updated at the indices without changing the
+    # original, when all of the indices are at the top level only the outermost list or
+    # dict needs to be copied, and the nested lists, tuples and dicts are shared
+    if all(len(idx) == 1 for idx in idxs):
+        return dict(nest) if isinstance(nest, dict) else list(nest)
+    return ivy.copy_nest(nest, to_mutable=True)
+
+
+def _nested_np_arrays(nest):
+    # specialised ivy.nested_indices_where for numpy arrays, with the same index order,
+    # which also returns the arrays found at the indices
+    idxs, arrays = [], []
+
+    def _walk(x, index):
+        if isinstance(x, np.ndarray):
+            idxs.append(index)
+            arrays.append(x)
+        elif isinstance(x, (list, tuple)):
+            for i, v in enumerate(x):
+                _walk(v, index + [i])
+        elif isinstance(x, dict):
+            for k, v in x.items():
+                _walk(v, index + [k])
+
+    _walk(nest, [])
+    return idxs, arrays
+
+
+def _create_array_vals(
+    *, np_vals, input_dtypes, as_variable_flags, native_array_flags, container_flags
+):
+    # builds each array in a single pass, applying all of its flags in turn
+    array_vals = []
+    for x, d, v, n, c in zip(
+        np_vals, input_dtypes, as_variable_flags, native_array_flags, container_flags
+    ):
+        x = ivy.array(x, dtype=d)
+        if v:
+            x = ivy.variable(x)
+        if n:
+            x = ivy.to_native(x)
+        if c:
+            x = as_cont(x=x)
+        array_vals.append(x)
+    return array_vals
+
+
 def create_args_kwargs(
     *,
     args_np,
@@ -721,15 +750,20 @@ def create_args_kwargs(
     as_variable_flags,
     native_array_flags=None,
     container_flags=None,
+    args_idxs=None,
+    kwargs_idxs=None,
 ):
 
-    # extract all arrays from the arguments and keyword arguments
-    args_idxs = ivy.nested_indices_where(args_np, lambda x: isinstance(x, np.ndarray))
-    arg_np_vals = ivy.multi_index_nest(args_np, args_idxs)
-    kwargs_idxs = ivy.nested_indices_where(
-        kwargs_np, lambda x: isinstance(x, np.ndarray)
-    )
-    kwarg_np_vals = ivy.multi_index_nest(kwargs_np, kwargs_idxs)
+    # extract all arrays from the arguments and keyword arguments, the indices can be
+    # passed in when the arrays were already found in the same args_np and kwargs_np
+    if args_idxs is None:
+        args_idxs, arg_np_vals = _nested_np_arrays(args_np)
+    else:
+        arg_np_vals = ivy.multi_index_nest(args_np, args_idxs)
+    if kwargs_idxs is None:
+        kwargs_idxs, kwarg_np_vals = _nested_np_arrays(kwargs_np)
+    else:
+        kwarg_np_vals = ivy.multi_index_nest(kwargs_np, kwargs_idxs)
 
     # assert that the number of arrays aligns with the dtypes and as_variable_flags
     num_arrays = len(arg_np_vals) + len(kwarg_np_vals)
@@ -745,46 +779,27 @@ def create_args_kwargs(
 
     # create args
     num_arg_vals = len(arg_np_vals)
-    arg_array_vals = [
-        ivy.array(x, dtype=d) for x, d in zip(arg_np_vals, input_dtypes[:num_arg_vals])
-    ]
-    arg_array_vals = [
-        ivy.variable(x) if v else x
-        for x, v in zip(arg_array_vals, as_variable_flags[:num_arg_vals])
-    ]
-    if native_array_flags:
-        arg_array_vals = [
-            ivy.to_native(x) if n else x
-            for x, n in zip(arg_array_vals, native_array_flags[:num_arg_vals])
-        ]
-    if container_flags:
-        arg_array_vals = [
-            as_cont(x=x) if c else x
-            for x, c in zip(arg_array_vals, container_flags[:num_arg_vals])
-        ]
-    args = ivy.copy_nest(args_np, to_mutable=True)
+    native_array_flags = ivy.default(native_array_flags, [False] * num_arrays)
+    container_flags = ivy.default(container_flags, [False] * num_arrays)
+    arg_array_vals = _create_array_vals(
+        np_vals=arg_np_vals,
+        input_dtypes=input_dtypes[:num_arg_vals],
+        as_variable_flags=as_variable_flags[:num_arg_vals],
+        native_array_flags=native_array_flags[:num_arg_vals],
+        container_flags=container_flags[:num_arg_vals],
+    )
+    args = _copy_nest_for_indices(args_np, args_idxs)
     ivy.set_nest_at_indices(args, args_idxs, arg_array_vals)
 
     # create kwargs
-    kwarg_array_vals = [
-        ivy.array(x, dtype=d)
-        for x, d in zip(kwarg_np_vals, input_dtypes[num_arg_vals:])
-    ]
-    kwarg_array_vals = [
-        ivy.variable(x) if v else x
-        for x, v in zip(kwarg_array_vals, as_variable_flags[num_arg_vals:])
-    ]
-    if native_array_flags:
-        kwarg_array_vals = [
-            ivy.to_native(x) if n else x
-            for x, n in zip(kwarg_array_vals, native_array_flags[num_arg_vals:])
-        ]
-    if container_flags:
-        kwarg_array_vals = [
-            as_cont(x=x) if c else x
-            for x, c in zip(kwarg_array_vals, container_flags[num_arg_vals:])
-        ]
-    kwargs = ivy.copy_nest(kwargs_np, to_mutable=True)
+    kwarg_array_vals = _create_array_vals(
+        np_vals=kwarg_np_vals,
+        input_dtypes=input_dtypes[num_arg_vals:],
+        as_variable_flags=as_variable_flags[num_arg_vals:],
+        native_array_flags=native_array_flags[num_arg_vals:],
+        container_flags=container_flags[num_arg_vals:],
+    )
+    kwargs = _copy_nest_for_indices(kwargs_np, kwargs_idxs)
     ivy.set_nest_at_indices(kwargs, kwargs_idxs, kwarg_array_vals)
     return args, kwargs, num_arg_vals, args_idxs, kwargs_idxs
 
@@ -874,7 +889,13 @@ def test_method(
     calling_args_np, calling_kwargs_np = kwargs_to_args_n_kwargs(
         num_positional_args=num_positional_args, kwargs=all_as_kwargs_np
     )
-    calling_args, calling_kwargs, _, _, _ = create_args_kwargs(
+    (
+        calling_args,
+        calling_kwargs,
+        _,
+        calling_args_idxs,
+        calling_kwargs_idxs,
+    ) = create_args_kwargs(
         args_np=calling_args_np,
         kwargs_np=calling_kwargs_np,
         input_dtypes=input_dtypes,
@@ -884,7 +905,13 @@ def test_method(
     constructor_args_np, constructor_kwargs_np = kwargs_to_args_n_kwargs(
         num_positional_args=num_positional_args_constructor, kwargs=constructor_kwargs
     )
-    constructor_args, constructor_kwargs, _, _, _ = create_args_kwargs(
+    (
+        constructor_args,
+        constructor_kwargs,
+        _,
+        constructor_args_idxs,
+        constructor_kwargs_idxs,
+    ) = create_args_kwargs(
         args_np=constructor_args_np,
         kwargs_np=constructor_kwargs_np,
         input_dtypes=input_dtypes_constructor,
@@ -893,6 +920,11 @@ def test_method(
     # run
     ins = ivy.__dict__[class_name](*constructor_args, **constructor_kwargs)
     ret, ret_np_flat = get_ret_and_flattened_array(ins, *calling_args, **calling_kwargs)
+    if ground_truth_backend == ivy.current_backend_str():
+        # the return would only be compared against itself
+        if not test_values:
+            return ret, ret
+        return
     # compute the return with a Ground Truth backend
     ivy.set_backend(ground_truth_backend)
     calling_args_gt, calling_kwargs_gt, _, _, _ = create_args_kwargs(
@@ -900,12 +932,16 @@ def test_method(
         kwargs_np=calling_kwargs_np,
         input_dtypes=input_dtypes,
         as_variable_flags=as_variable_flags,
+        args_idxs=calling_args_idxs,
+        kwargs_idxs=calling_kwargs_idxs,
     )
     constructor_args_gt, constructor_kwargs_gt, _, _, _ = create_args_kwargs(
         args_np=constructor_args_np,
         kwargs_np=constructor_kwargs_np,
         input_dtypes=input_dtypes_constructor,
         as_variable_flags=as_variable_flags_constructor,
+        args_idxs=constructor_args_idxs,
+        kwargs_idxs=constructor_kwargs_idxs,
     )
     ins_gt = ivy.__dict__[class_name](*constructor_args_gt, **constructor_kwargs_gt)
     ret_from_gt, ret_np_from_gt_flat = get_ret_and_flattened_array(
@@ -1061,7 +1097,8 @@ def test_function(
         num_positional_args=num_positional_args, kwargs=all_as_kwargs_np
     )
 
-    fn = getattr(ivy, fn_name)
+    fn = ivy.__dict__[fn_name]
+    any_container = any(container_flags)
     test_unsupported = check_unsupported_dtype(
         fn=fn, input_dtypes=input_dtypes, all_as_kwargs_np=all_as_kwargs_np
     )
@@ -1113,7 +1150,7 @@ def test_function(
                     break
             instance_idx = args_idxs[i]
             instance = ivy.index_nest(args, instance_idx)
-            args = ivy.copy_nest(args, to_mutable=True)
+            args = _copy_nest_for_indices(args, [instance_idx])
             ivy.prune_nest_at_index(args, instance_idx)
         else:
             i = 0
@@ -1122,50 +1159,34 @@ def test_function(
                     break
             instance_idx = kwargs_idxs[i]
             instance = ivy.index_nest(kwargs, instance_idx)
-            kwargs = ivy.copy_nest(kwargs, to_mutable=True)
+            kwargs = _copy_nest_for_indices(kwargs, [instance_idx])
             ivy.prune_nest_at_index(kwargs, instance_idx)
-        if test_unsupported:
-            test_unsupported_function(
-                fn=instance.__getattribute__(fn_name), args=args, kwargs=kwargs
-            )
-            return
-
-        ret, ret_np_flat = get_ret_and_flattened_array(
-            instance.__getattribute__(fn_name), *args, **kwargs
-        )
+        fn_to_call = instance.__getattribute__(fn_name)
     else:
-        if test_unsupported:
-            test_unsupported_function(
-                fn=ivy.__dict__[fn_name], args=args, kwargs=kwargs
-            )
-            return
-        ret, ret_np_flat = get_ret_and_flattened_array(
-            ivy.__dict__[fn_name], *args, **kwargs
-        )
+        fn_to_call = fn
+    if test_unsupported:
+        test_unsupported_function(fn=fn_to_call, args=args, kwargs=kwargs)
+        return
+    ret, ret_np_flat = get_ret_and_flattened_array(fn_to_call, *args, **kwargs)
     # assert idx of return if the idx of the out array provided
     if with_out:
         out = ivy.zeros_like(ret)
         assert not isinstance(ret, tuple)
-        if max(container_flags):
+        if any_container:
             assert ivy.is_ivy_container(ret)
         else:
             assert ivy.is_array(ret)
-        if instance_method:
-            ret, ret_np_flat = get_ret_and_flattened_array(
-                instance.__getattribute__(fn_name), *args, **kwargs, out=out
-            )
-        else:
-            ret, ret_np_flat = get_ret_and_flattened_array(
-                ivy.__dict__[fn_name], *args, **kwargs, out=out
-            )
+        ret, ret_np_flat = get_ret_and_flattened_array(
+            fn_to_call, *args, **kwargs, out=out
+        )
         assert ret is out
-        if not max(container_flags) and ivy.native_inplace_support:
+        if not any_container and ivy.native_inplace_support:
             # these backends do not always support native inplace updates
             assert ret.data is out.data
     # compute the return with a Ground Truth backend
     ivy.set_backend(ground_truth_backend)
     try:
-        fn = getattr(ivy, fn_name)
+        fn = ivy.__dict__[fn_name]
         test_unsupported = check_unsupported_dtype(
             fn=fn, input_dtypes=input_dtypes, all_as_kwargs_np=all_as_kwargs_np
         )
@@ -1179,6 +1200,8 @@ def test_function(
                     as_variable_flags=as_variable_flags,
                     native_array_flags=native_array_flags,
                     container_flags=container_flags,
+                    args_idxs=args_idxs,
+                    kwargs_idxs=kwargs_idxs,
                 )
             except Exception:
                 ivy.unset_backend()
@@ -1191,15 +1214,15 @@ def test_function(
                 as_variable_flags=as_variable_flags,
                 native_array_flags=native_array_flags,
                 container_flags=container_flags,
+                args_idxs=args_idxs,
+                kwargs_idxs=kwargs_idxs,
             )
         if test_unsupported:
-            test_unsupported_function(
-                fn=ivy.__dict__[fn_name], args=args, kwargs=kwargs
-            )
+            test_unsupported_function(fn=fn, args=args, kwargs=kwargs)
             ivy.unset_backend()
             return
         ret_from_gt, ret_np_from_gt_flat = get_ret_and_flattened_array(
-            ivy.__dict__[fn_name], *args, **kwargs
+            fn, *args, **kwargs
         )
     except Exception as e:
         ivy.unset_backend()
@@ -1210,7 +1233,7 @@ def test_function(
         test_gradients
         and not fw == "numpy"
         and all(as_variable_flags)
-        and not any(container_flags)
+        and not any_container
         and not instance_method
     ):
         gradient_test(
@@ -1308,9 +1331,9 @@ def test_frontend_function(
     *frontend_submods, fn_name = fn_name.split(".")
 
     # check for unsupported dtypes in backend framework
-    function = getattr(ivy.functional.frontends.__dict__[frontend], fn_name)
+    frontend_fn = ivy.functional.frontends.__dict__[frontend].__dict__[fn_name]
     test_unsupported = check_unsupported_dtype(
-        fn=function, input_dtypes=input_dtypes, all_as_kwargs_np=all_as_kwargs_np
+        fn=frontend_fn, input_dtypes=input_dtypes, all_as_kwargs_np=all_as_kwargs_np
     )
 
     # split the arguments into their positional and keyword components
@@ -1344,9 +1367,6 @@ def test_frontend_function(
         )
         args_ivy, kwargs_ivy = ivy.args_to_ivy(*args, **kwargs)
 
-    # frontend function
-    frontend_fn = ivy.functional.frontends.__dict__[frontend].__dict__[fn_name]
-
     # run from the Ivy API directly
     if test_unsupported:
         test_unsupported_function(fn=frontend_fn, args=args, kwargs=kwargs)
@@ -1385,9 +1405,8 @@ def test_frontend_function(
     ivy.set_backend(frontend)
     try:
         # check for unsupported dtypes in frontend framework
-        function = getattr(ivy.functional.frontends.__dict__[frontend], fn_name)
         test_unsupported = check_unsupported_dtype(
-            fn=function, input_dtypes=input_dtypes, all_as_kwargs_np=all_as_kwargs_np
+            fn=frontend_fn, input_dtypes=input_dtypes, all_as_kwargs_np=all_as_kwargs_np
         )
 
         # create frontend framework args
@@ -1406,14 +1425,13 @@ def test_frontend_function(
 
         # compute the return via the frontend framework
         frontend_fw = importlib.import_module(".".join([frontend] + frontend_submods))
+        frontend_fw_fn = frontend_fw.__dict__[fn_name]
         if test_unsupported:
             test_unsupported_function(
-                fn=frontend_fw.__dict__[fn_name],
-                args=args_frontend,
-                kwargs=kwargs_frontend,
+                fn=frontend_fw_fn, args=args_frontend, kwargs=kwargs_frontend
             )
             return
-        frontend_ret = frontend_fw.__dict__[fn_name](*args_frontend, **kwargs_frontend)
+        frontend_ret = frontend_fw_fn(*args_frontend, **kwargs_frontend)
 
         # tuplify the frontend return
         if not isinstance(frontend_ret, tuple):
@@ -1,6 +1,8 @@
 """Collection of tests for unified reduction functions."""
 
 # global
+import pytest
+from types import SimpleNamespace
 import numpy as np
 from hypothesis import given, strategies as st
 
@@ -166,6 +168,56 @@ def test_multinomial(everything, device, call):
     assert ret.shape == tuple([batch_size, num_samples])
 
 
+
+# multinomial sampling with replacement in the numpy backend
+@pytest.mark.parametrize(
+    "num_samples_n_draws",
+    [
+        # Gumbel-max sampling
+        (50, 400),
+        # inverse-CDF sampling
+        (20000, 1),
+    ],
+)
+def test_numpy_multinomial_with_replacement(num_samples_n_draws, device, call):
+    if call is not helpers.np_call:
+        # the vectorised samplers are specific to the numpy backend
+        pytest.skip()
+    num_samples, num_draws = num_samples_n_draws
+    probs = np.array([[0.1, 0.2, 0.3, 0.4, 0.0], [0.0, 0.5, 0.0, 0.5, 0.0]])
+    ret = np.concatenate(
+        [
+            ivy_np.multinomial(5, num_samples, probs=probs, device=device)
+            for _ in range(num_draws)
+        ],
+        -1,
+    )
+    assert ret.shape == (2, num_samples * num_draws)
+    freqs = np.stack([np.bincount(row, minlength=5) for row in ret]) / ret.shape[-1]
+    assert np.allclose(freqs, probs, atol=0.02)
+    # classes with zero probability must never be drawn
+    assert np.all(freqs[probs == 0] == 0)
+    # the result is written to out when it is given
+    out = np.zeros((2, num_samples), dtype="int64")
+    ret = ivy_np.multinomial(5, num_samples, probs=probs, device=device, out=out)
+    assert np.shares_memory(ret, out)
+    assert np.all(probs[np.arange(2)[:, None], out] > 0)
+
+
+# multinomial inverse-CDF sampling at the edges of the unit interval
+@pytest.mark.parametrize("u", [0.0, np.nextafter(1.0, 0.0)])
+def test_numpy_multinomial_with_replacement_bounds(u, device, call, monkeypatch):
+    if call is not helpers.np_call:
+        # the vectorised samplers are specific to the numpy backend
+        pytest.skip()
+    rng = SimpleNamespace(random=lambda size: np.full(size, u))
+    monkeypatch.setattr(ivy_np.random, "_rng", rng)
+    probs = np.array([[0.0, 0.3, 0.7, 0.0]] * 4)
+    # enough samples to use inverse-CDF rather than Gumbel-max sampling
+    num_samples = 128
+    ret = ivy_np.multinomial(4, num_samples, probs=probs, device=device)
+    assert np.all(ret == (1 if u == 0.0 else 2))
+
 # randint
 @given(
     dtype_and_low=helpers.dtype_and_values(
@@ -473,6 +473,34 @@ def test_conv2d(
     )
 
 
+
+# conv2d with the numpy overlap-add fast path
+@pytest.mark.parametrize("filter_shape", [[5, 5], [7, 4]])
+@pytest.mark.parametrize("dilations", [1, 2])
+@pytest.mark.parametrize("padding", ["VALID", "SAME"])
+@pytest.mark.parametrize("data_format", ["NHWC", "NCHW"])
+def test_numpy_conv2d_fft_path(
+    filter_shape, dilations, padding, data_format, call, monkeypatch
+):
+    if call is not helpers.np_call:
+        # the overlap-add path is specific to the numpy backend
+        pytest.skip()
+    pytest.importorskip("scipy.signal")
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((2, 17, 15, 3)).astype("float32")
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 3, 1, 2))
+    filters = rng.standard_normal(filter_shape + [3, 4]).astype("float32")
+    ret = ivy_np.layers.conv2d(x, filters, [1, 1], padding, data_format, dilations)
+    monkeypatch.setattr(ivy_np.layers, "oaconvolve", None)
+    true_res = ivy_np.layers.conv2d(
+        x, filters, [1, 1], padding, data_format, dilations
+    )
+    assert ret.dtype == true_res.dtype
+    assert ret.shape == true_res.shape
+    assert np.allclose(ret, true_res, rtol=1e-4, atol=1e-4)
+
+
 # conv2d_transpose
 @given(
     array_shape=helpers.lists(arg=st.integers(1, 5), min_size=3, max_size=3),
@@ -594,6 +622,38 @@ def test_depthwise_conv2d(
     )
 
 
+
+def _naive_conv2d(x, filters, strides):
+    # NHWC, VALID padding, filters of shape KH x KW x I x O
+    kh, kw = filters.shape[0:2]
+    out_h = (x.shape[1] - kh) // strides[0] + 1
+    out_w = (x.shape[2] - kw) // strides[1] + 1
+    res = np.zeros((x.shape[0], out_h, out_w, filters.shape[-1]), x.dtype)
+    for i in range(out_h):
+        for j in range(out_w):
+            h, w = i * strides[0], j * strides[1]
+            window = x[:, h : h + kh, w : w + kw]
+            res[:, i, j] = np.tensordot(window, filters, ((1, 2, 3), (0, 1, 2)))
+    return res
+
+
+# conv2d and depthwise_conv2d with non-square strides in the numpy backend
+@pytest.mark.parametrize("strides", [[1, 2], [2, 1], [3, 2]])
+def test_numpy_conv2d_non_square_strides(strides, call):
+    if call is not helpers.np_call:
+        # the reference is compared against the numpy backend directly
+        pytest.skip()
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((2, 9, 8, 3))
+    filters = rng.standard_normal((3, 2, 3, 4))
+    ret = ivy_np.layers.conv2d(x, filters, strides, "VALID")
+    assert np.allclose(ret, _naive_conv2d(x, filters, strides))
+    depthwise_filters = rng.standard_normal((3, 2, 3))
+    ret = ivy_np.layers.depthwise_conv2d(x, depthwise_filters, strides, "VALID")
+    diag_filters = np.einsum("ijc,cd->ijcd", depthwise_filters, np.eye(3))
+    assert np.allclose(ret, _naive_conv2d(x, diag_filters, strides))
+
+
 # conv3d
 @given(
     x_f_d_df=x_and_filters(